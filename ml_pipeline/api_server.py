@@ -6,16 +6,29 @@ Connects the ML model to your React frontend
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 from train_model import FakeNewsDetector
+from near_duplicate_index import NearDuplicateIndex
+import numpy as np
+import atexit
+import os
 import re
 
 app = Flask(__name__)
 CORS(app)
 
-detector = FakeNewsDetector()
+MODEL_PATH = 'fake_news_model_final.pkl'
+# The persisted index assumes a single writer: with several worker processes
+# give each its own DEDUP_INDEX_PATH, or set it empty to disable persistence
+DEDUP_INDEX_PATH = os.environ.get('DEDUP_INDEX_PATH', 'near_duplicate_index.pkl')
+DEDUP_THRESHOLD = float(os.environ.get('DEDUP_THRESHOLD', '0.8'))
+DEDUP_MAX_ENTRIES = int(os.environ.get('DEDUP_MAX_ENTRIES', '10000'))
+DEDUP_SAVE_EVERY = int(os.environ.get('DEDUP_SAVE_EVERY', '500'))
+EMBEDDING_DTYPE = os.environ.get('EMBEDDING_DTYPE') or None
+
+detector = FakeNewsDetector(embedding_dtype=EMBEDDING_DTYPE)
 
 try:
     print("Loading model...")
-    detector.load_model('fake_news_model_final.pkl')
+    detector.load_model(MODEL_PATH)
     detector.load_glove_embeddings()
     print("Model loaded successfully!")
 except Exception as e:
@@ -23,6 +36,86 @@ except Exception as e:
     print("API will run but predictions will fail until model is trained.")
 
 
+def dedup_metadata():
+    """What stored verdicts depend on; a persisted index must match it"""
+    try:
+        model_mtime = os.path.getmtime(MODEL_PATH)
+    except OSError:
+        model_mtime = None
+    return {
+        'model_path': os.path.abspath(MODEL_PATH),
+        'model_mtime': model_mtime,
+        'embedding_dtype': EMBEDDING_DTYPE
+    }
+
+
+def load_dedup_index():
+    """Load persisted near-duplicate index, discarding it if the model or embedding mode changed"""
+    metadata = dedup_metadata()
+    if DEDUP_INDEX_PATH and os.path.exists(DEDUP_INDEX_PATH):
+        try:
+            index = NearDuplicateIndex.load(DEDUP_INDEX_PATH)
+            if index.metadata == metadata:
+                index.threshold = DEDUP_THRESHOLD
+                index.max_entries = DEDUP_MAX_ENTRIES
+                return index
+            print("Near-duplicate index was built for a different model or embedding mode, starting empty.")
+        except Exception as e:
+            print(f"Warning: Could not load near-duplicate index - {e}")
+            print("Starting with an empty near-duplicate index.")
+    return NearDuplicateIndex(
+        threshold=DEDUP_THRESHOLD,
+        max_entries=DEDUP_MAX_ENTRIES,
+        metadata=metadata
+    )
+
+
+def save_dedup_index():
+    """Persist the index if it has entries this process has not saved yet"""
+    if not DEDUP_INDEX_PATH or dedup_index.unsaved_changes == 0:
+        return
+    try:
+        dedup_index.save(DEDUP_INDEX_PATH)
+    except Exception as e:
+        print(f"Warning: Could not save near-duplicate index - {e}")
+
+
+dedup_index = load_dedup_index()
+# Processes that never scored anything (e.g. the debug reloader's parent)
+# have no unsaved changes and so never overwrite the file
+atexit.register(save_dedup_index)
+
+
+def predict_with_dedup(texts):
+    """
+    Predict probabilities for texts, reusing stored verdicts of
+    near-duplicate articles and scoring only the remaining ones.
+    Returns (predictions, probabilities, duplicate_flags).
+    """
+    processed_texts = [detector.preprocess_text(text) for text in texts]
+    signatures = [dedup_index.signature(text) for text in processed_texts]
+
+    probabilities = [None] * len(texts)
+    duplicates = [False] * len(texts)
+    for i, (processed, signature) in enumerate(zip(processed_texts, signatures)):
+        stored, _ = dedup_index.lookup(processed, signature=signature)
+        if stored is not None:
+            probabilities[i] = stored
+            duplicates[i] = True
+
+    misses = [i for i, proba in enumerate(probabilities) if proba is None]
+    if misses:
+        _, scored = detector.predict_processed([processed_texts[i] for i in misses])
+        for i, proba in zip(misses, scored):
+            probabilities[i] = proba
+            dedup_index.add(processed_texts[i], proba, signature=signatures[i])
+        if dedup_index.unsaved_changes >= DEDUP_SAVE_EVERY:
+            save_dedup_index()
+
+    predictions = [int(np.argmax(proba)) for proba in probabilities]
+    return predictions, probabilities, duplicates
+
+
 def analyze_text_features(text):
     """Extract text statistics and indicators"""
     words = text.split()
@@ -65,7 +158,8 @@ def health_check():
     """Health check endpoint"""
     return jsonify({
         'status': 'healthy',
-        'model_loaded': detector.classifier is not None
+        'model_loaded': detector.classifier is not None,
+        'dedup_index_size': len(dedup_index)
     })
 
 
@@ -81,7 +175,7 @@ def analyze():
                 'error': 'Text too short. Please provide at least 50 characters.'
             }), 400
 
-        predictions, probabilities = detector.predict([text])
+        predictions, probabilities, duplicates = predict_with_dedup([text])
 
         features = analyze_text_features(text)
 
@@ -125,7 +219,8 @@ def analyze():
                 'sentence_count': features['sentence_count'],
                 'avg_sentence_length': round(features['avg_sentence_length'], 1)
             },
-            'warnings': warnings
+            'warnings': warnings,
+            'near_duplicate': duplicates[0]
         })
 
     except Exception as e:
@@ -144,7 +239,7 @@ def batch_analyze():
         if not texts or len(texts) == 0:
             return jsonify({'error': 'No texts provided'}), 400
 
-        predictions, probabilities = detector.predict(texts)
+        predictions, probabilities, duplicates = predict_with_dedup(texts)
 
         results = []
         for i, text in enumerate(texts):
@@ -156,7 +251,8 @@ def batch_analyze():
                 'text_id': i,
                 'verdict': verdict,
                 'confidence': round(confidence, 1),
-                'credibility': round(credibility)
+                'credibility': round(credibility),
+                'near_duplicate': duplicates[i]
             })
 
         return jsonify({'results': results})
@@ -0,0 +1,115 @@
+"""
+Feature Selection Benchmark
+Compares model size, training time, per-request latency and accuracy
+for the full TF-IDF feature space against chi-squared and L1 selection
+
+Usage: python benchmark_feature_selection.py
+Requires the same 'fake_news_dataset.csv' as train_model.py
+"""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.model_selection import train_test_split
+
+from near_duplicate_index import NearDuplicateIndex
+from train_model import FakeNewsDetector, load_dataset
+
+DATASET_PATH = 'fake_news_dataset.csv'
+LATENCY_SAMPLES = 200
+
+CONFIGURATIONS = [
+    (None, None),
+    ('chi2', 2000),
+    ('chi2', 1000),
+    ('chi2', 500),
+    ('l1', 2000),
+    ('l1', 1000),
+    ('l1', 500),
+]
+
+
+def benchmark_configuration(feature_selection, k_features, word2vec_model,
+                            X_train_text, X_test_text, y_train, y_test):
+    """Train one configuration and collect its metrics"""
+    detector = FakeNewsDetector(feature_selection=feature_selection, k_features=k_features or 2000)
+    detector.word2vec_model = word2vec_model
+
+    start = time.perf_counter()
+    X_train = detector.extract_features(X_train_text, fit=True, labels=y_train)
+    detector.train(X_train, y_train)
+    training_time = time.perf_counter() - start
+
+    y_pred, _ = detector.predict_processed(X_test_text)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        model_path = os.path.join(tmpdir, 'model.pkl')
+        detector.save_model(model_path)
+        model_size = os.path.getsize(model_path)
+
+    latencies = []
+    for text in X_test_text[:LATENCY_SAMPLES]:
+        start = time.perf_counter()
+        detector.predict_processed([text])
+        latencies.append(time.perf_counter() - start)
+
+    return {
+        'name': 'full' if feature_selection is None else f'{feature_selection} k={k_features}',
+        'n_features': X_train.shape[1],
+        'model_size_mb': model_size / (1024 * 1024),
+        'training_time_s': training_time,
+        'latency_p50_ms': np.percentile(latencies, 50) * 1000,
+        'latency_p95_ms': np.percentile(latencies, 95) * 1000,
+        'accuracy': accuracy_score(y_test, y_pred),
+        'f1': f1_score(y_test, y_pred)
+    }
+
+
+def main():
+    print("="*70)
+    print("FEATURE SELECTION BENCHMARK")
+    print("="*70)
+
+    df = load_dataset(DATASET_PATH)
+
+    detector = FakeNewsDetector()
+    detector.load_glove_embeddings()
+
+    print("\nPreprocessing texts...")
+    processed_texts = [detector.preprocess_text(text) for text in df['text'].values]
+    labels = df['label'].values
+
+    keep = NearDuplicateIndex(threshold=0.8, max_entries=len(processed_texts)).deduplicate(processed_texts)
+    processed_texts = [processed_texts[i] for i in keep]
+    labels = labels[keep]
+
+    X_train_text, X_test_text, y_train, y_test = train_test_split(
+        processed_texts, labels, test_size=0.2, random_state=42, stratify=labels
+    )
+
+    results = []
+    for feature_selection, k_features in CONFIGURATIONS:
+        print("\n" + "-"*70)
+        print(f"CONFIGURATION: feature_selection={feature_selection}, k={k_features}")
+        print("-"*70)
+        results.append(benchmark_configuration(
+            feature_selection, k_features, detector.word2vec_model,
+            X_train_text, X_test_text, y_train, y_test
+        ))
+
+    print("\n" + "="*70)
+    print("RESULTS")
+    print("="*70)
+    print(f"{'Config':<14} {'Features':>8} {'Size MB':>8} {'Train s':>8} "
+          f"{'p50 ms':>7} {'p95 ms':>7} {'Accuracy':>9} {'F1':>7}")
+    print("-"*78)
+    for r in results:
+        print(f"{r['name']:<14} {r['n_features']:>8d} {r['model_size_mb']:>8.1f} {r['training_time_s']:>8.1f} "
+              f"{r['latency_p50_ms']:>7.1f} {r['latency_p95_ms']:>7.1f} {r['accuracy']:>9.4f} {r['f1']:>7.4f}")
+
+
+if __name__ == "__main__":
+    main()
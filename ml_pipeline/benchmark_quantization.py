@@ -0,0 +1,90 @@
+"""
+Embedding Quantization Report
+Compares accuracy and per-worker embedding memory of the float32
+embedding table against the float16 and int8 quantized modes
+
+Usage: python benchmark_quantization.py
+Requires 'fake_news_dataset.csv' and a trained 'fake_news_model_final.pkl'
+"""
+
+import numpy as np
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.model_selection import train_test_split
+
+from near_duplicate_index import NearDuplicateIndex
+from quantized_embeddings import QuantizedEmbeddings, QUANTIZED_DTYPES
+from train_model import FakeNewsDetector, load_dataset
+
+DATASET_PATH = 'fake_news_dataset.csv'
+MODEL_PATH = 'fake_news_model_final.pkl'
+
+
+def main():
+    print("="*70)
+    print("EMBEDDING QUANTIZATION REPORT")
+    print("="*70)
+
+    df = load_dataset(DATASET_PATH)
+
+    detector = FakeNewsDetector()
+    detector.load_model(MODEL_PATH)
+    detector.load_glove_embeddings()
+    full_embeddings = detector.word2vec_model
+
+    print("\nPreprocessing texts...")
+    processed_texts = [detector.preprocess_text(text) for text in df['text'].values]
+    labels = df['label'].values
+
+    # Same deduplication and split as train_model.py, so this is the held-out half
+    keep = NearDuplicateIndex(threshold=0.8, max_entries=len(processed_texts)).deduplicate(processed_texts)
+    processed_texts = [processed_texts[i] for i in keep]
+    labels = labels[keep]
+
+    _, X_test_text, _, y_test = train_test_split(
+        processed_texts, labels, test_size=0.2, random_state=42, stratify=labels
+    )
+
+    results = []
+    baseline_predictions = None
+    for dtype in ('float32',) + QUANTIZED_DTYPES:
+        print("\n" + "-"*70)
+        print(f"EMBEDDING DTYPE: {dtype}")
+        print("-"*70)
+        if dtype == 'float32':
+            detector.embedding_dtype = None
+            detector.word2vec_model = full_embeddings
+            embedding_bytes = full_embeddings.vectors.nbytes
+        else:
+            detector.embedding_dtype = dtype
+            detector.word2vec_model = QuantizedEmbeddings(full_embeddings, dtype=dtype)
+            embedding_bytes = detector.word2vec_model.nbytes
+
+        features = detector.extract_features(X_test_text, fit=False)
+        predictions = detector.classifier.predict(features)
+        if baseline_predictions is None:
+            baseline_predictions = predictions
+
+        results.append({
+            'dtype': dtype,
+            'embedding_mb': embedding_bytes / 2**20,
+            'features_mb': (features.data.nbytes + features.indices.nbytes + features.indptr.nbytes) / 2**20,
+            'accuracy': accuracy_score(y_test, predictions),
+            'f1': f1_score(y_test, predictions),
+            'agreement': np.mean(predictions == baseline_predictions)
+        })
+
+    baseline = results[0]
+    print("\n" + "="*70)
+    print("RESULTS (per API worker)")
+    print("="*70)
+    print(f"{'Dtype':<9} {'Table MB':>9} {'Saved MB':>9} {'Test feat MB':>13} "
+          f"{'Accuracy':>9} {'Delta':>8} {'F1':>7} {'Agree':>7}")
+    print("-"*78)
+    for r in results:
+        print(f"{r['dtype']:<9} {r['embedding_mb']:>9.1f} {baseline['embedding_mb'] - r['embedding_mb']:>9.1f} "
+              f"{r['features_mb']:>13.1f} {r['accuracy']:>9.4f} {r['accuracy'] - baseline['accuracy']:>+8.4f} "
+              f"{r['f1']:>7.4f} {r['agreement']:>7.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Near-Duplicate Article Index
+MinHash + LSH over preprocessed article text
+
+News feeds repeat the same story with small edits (headlines, bylines,
+tracking URLs). This index finds previously scored articles whose word
+shingles overlap above a Jaccard similarity threshold, so their stored
+verdict can be reused instead of re-scoring. It is also used to
+deduplicate the training corpus before the train/test split.
+
+The index is bounded (least recently used entries are evicted) and can be
+persisted to disk with pickle, like the trained model. Each entry costs
+about 3 KB with the default 128 permutations / 32 bands (the MinHash
+signature, one LSH bucket slot per band and the stored value), so the
+default 10,000 entries take roughly 30 MB.
+"""
+
+import os
+import pickle
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+
+# Mersenne prime 2^31 - 1 keeps (a * hash + b) within uint64 for 32-bit hashes
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+# FNV-1a style mixing of a band's rows into one bucket key; masked to 60 bits
+# so the keys stay compact Python ints. Collisions only add candidates,
+# which are verified against the full signature.
+_FNV_PRIME = np.uint64(1099511628211)
+_BUCKET_MASK = (1 << 60) - 1
+
+
+class NearDuplicateIndex:
+    def __init__(self, threshold=0.8, num_perm=128, num_bands=32,
+                 shingle_size=3, max_entries=10000, seed=42, metadata=None):
+        if num_perm % num_bands != 0:
+            raise ValueError("num_perm must be divisible by num_bands")
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.num_bands = num_bands
+        self.rows_per_band = num_perm // num_bands
+        self.shingle_size = shingle_size
+        self.max_entries = max_entries
+        # Free-form description of what the stored values depend on
+        # (e.g. model file and version), checked by callers on load
+        self.metadata = dict(metadata or {})
+
+        rng = np.random.RandomState(seed)
+        self._perm_a = rng.randint(1, int(_MERSENNE_PRIME), size=num_perm).astype(np.uint64)
+        self._perm_b = rng.randint(0, int(_MERSENNE_PRIME), size=num_perm).astype(np.uint64)
+
+        self._band_salts = rng.randint(1, 2**62, size=num_bands, dtype=np.int64).astype(np.uint64)
+
+        self._entries = OrderedDict()
+        # bucket key -> entry key, or a list of entry keys on collision
+        self._buckets = {}
+        self._next_key = 0
+        self.unsaved_changes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _shingles(self, processed_text):
+        """Word n-gram shingles; short texts fall back to single words"""
+        tokens = processed_text.split()
+        size = min(self.shingle_size, len(tokens))
+        if size == 0:
+            return set()
+        return {' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+    def signature(self, processed_text):
+        """MinHash signature of a preprocessed text (None if it has no tokens)"""
+        shingles = self._shingles(processed_text)
+        if not shingles:
+            return None
+
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode('utf-8')) for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles)
+        )
+        permuted = (np.outer(hashes, self._perm_a) + self._perm_b) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=0).astype(np.uint32)
+
+    def _band_keys(self, signature):
+        """One integer bucket key per LSH band"""
+        rows = signature.reshape(self.num_bands, self.rows_per_band).astype(np.uint64)
+        keys = self._band_salts.copy()
+        for r in range(self.rows_per_band):
+            keys = (keys ^ rows[:, r]) * _FNV_PRIME
+        return [key & _BUCKET_MASK for key in keys.tolist()]
+
+    def _query(self, signature):
+        best_key, best_similarity = None, 0.0
+        candidates = set()
+        for band_key in self._band_keys(signature):
+            bucket = self._buckets.get(band_key)
+            if isinstance(bucket, list):
+                candidates.update(bucket)
+            elif bucket is not None:
+                candidates.add(bucket)
+
+        for key in candidates:
+            similarity = float(np.mean(self._entries[key][0] == signature))
+            if similarity > best_similarity:
+                best_key, best_similarity = key, similarity
+
+        if best_key is None or best_similarity < self.threshold:
+            return None, best_similarity
+        return best_key, best_similarity
+
+    def lookup(self, processed_text, signature=None):
+        """
+        Return (value, similarity) for the most similar stored article
+        above the threshold, or (None, similarity) when there is no match.
+        """
+        if signature is None:
+            signature = self.signature(processed_text)
+        if signature is None:
+            return None, 0.0
+
+        with self._lock:
+            key, similarity = self._query(signature)
+            if key is None:
+                return None, similarity
+            self._entries.move_to_end(key)
+            return self._entries[key][1], similarity
+
+    def add(self, processed_text, value, signature=None):
+        """Store a value (e.g. class probabilities) for a preprocessed text"""
+        if signature is None:
+            signature = self.signature(processed_text)
+        if signature is None:
+            return
+
+        with self._lock:
+            key = self._next_key
+            self._next_key += 1
+            self._entries[key] = (signature, value)
+            for band_key in self._band_keys(signature):
+                bucket = self._buckets.get(band_key)
+                if bucket is None:
+                    self._buckets[band_key] = key
+                elif isinstance(bucket, list):
+                    bucket.append(key)
+                else:
+                    self._buckets[band_key] = [bucket, key]
+            self.unsaved_changes += 1
+
+            while len(self._entries) > self.max_entries:
+                self._evict_oldest()
+
+    def _evict_oldest(self):
+        key, (signature, _) = self._entries.popitem(last=False)
+        for band_key in self._band_keys(signature):
+            bucket = self._buckets.get(band_key)
+            if isinstance(bucket, list):
+                if key in bucket:
+                    bucket.remove(key)
+                if len(bucket) == 1:
+                    self._buckets[band_key] = bucket[0]
+            elif bucket == key:
+                del self._buckets[band_key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._buckets = {}
+            self.unsaved_changes += 1
+
+    def deduplicate(self, processed_texts):
+        """
+        Return indices of texts to keep, dropping any text that is a
+        near-duplicate of an earlier one. Uses (and fills) this index.
+        """
+        keep = []
+        for i, text in enumerate(processed_texts):
+            signature = self.signature(text)
+            if signature is not None:
+                match, _ = self.lookup(text, signature=signature)
+                if match is not None:
+                    continue
+                self.add(text, i, signature=signature)
+            keep.append(i)
+        return keep
+
+    def save(self, filepath='near_duplicate_index.pkl'):
+        """
+        Persist index to disk. Written to a temporary file and moved into
+        place, so an interrupted save never leaves a truncated index.
+        """
+        directory = os.path.dirname(os.path.abspath(filepath))
+        with self._lock:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(self, f)
+                os.replace(tmp_path, filepath)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+            self.unsaved_changes = 0
+        print(f"Near-duplicate index saved to {filepath} ({len(self)} entries)")
+
+    @classmethod
+    def load(cls, filepath='near_duplicate_index.pkl'):
+        """Load a persisted index from disk"""
+        with open(filepath, 'rb') as f:
+            index = pickle.load(f)
+        if not isinstance(index, cls):
+            raise ValueError(f"{filepath} does not contain a NearDuplicateIndex")
+        print(f"Near-duplicate index loaded from {filepath} ({len(index)} entries)")
+        return index
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.unsaved_changes = 0
+        self._lock = threading.Lock()
@@ -0,0 +1,56 @@
+"""
+Quantized Word Embeddings
+Low-memory float16 / per-row-scaled int8 copy of a gensim KeyedVectors table
+
+The GloVe / Word2Vec table is most of the resident memory of each API
+worker. Storing it as float16 halves it; int8 with one float32 scale per
+row quarters it. Rows are dequantized to float32 on lookup, so document
+means are still accumulated in float32.
+"""
+
+import numpy as np
+
+QUANTIZED_DTYPES = ('float16', 'int8')
+
+# Rows quantized per step, bounds the float32 temporary during conversion
+_CHUNK_ROWS = 50000
+
+
+class QuantizedEmbeddings:
+    def __init__(self, keyed_vectors, dtype='float16'):
+        if dtype not in QUANTIZED_DTYPES:
+            raise ValueError(f"dtype must be one of {QUANTIZED_DTYPES}")
+
+        self.dtype = dtype
+        self.key_to_index = keyed_vectors.key_to_index
+        self.vector_size = keyed_vectors.vector_size
+
+        vectors = keyed_vectors.vectors
+        if dtype == 'float16':
+            self.vectors = vectors.astype(np.float16)
+            self.scales = None
+        else:
+            self.vectors = np.empty(vectors.shape, dtype=np.int8)
+            self.scales = np.empty(len(vectors), dtype=np.float32)
+            for start in range(0, len(vectors), _CHUNK_ROWS):
+                chunk = np.asarray(vectors[start:start + _CHUNK_ROWS], dtype=np.float32)
+                scales = np.abs(chunk).max(axis=1) / 127.0
+                scales[scales == 0] = 1.0
+                self.vectors[start:start + len(chunk)] = np.round(chunk / scales[:, None])
+                self.scales[start:start + len(chunk)] = scales
+
+    def __contains__(self, key):
+        return key in self.key_to_index
+
+    def __getitem__(self, key):
+        """Dequantized float32 vector for a word"""
+        index = self.key_to_index[key]
+        vector = self.vectors[index].astype(np.float32)
+        if self.scales is not None:
+            vector *= self.scales[index]
+        return vector
+
+    @property
+    def nbytes(self):
+        """Memory held by the vector table (excluding the vocabulary)"""
+        return self.vectors.nbytes + (self.scales.nbytes if self.scales is not None else 0)
@@ -8,6 +8,8 @@ Label: 1 = Real, 0 = Fake
 This script includes:
 - Advanced text preprocessing (7 steps)
 - Hybrid TF-IDF + Word2Vec feature extraction with GloVe
+- Optional chi-squared / L1 TF-IDF feature selection
+- Optional float16 / int8 quantized embeddings for low-memory serving
 - Multiple ML classifiers with ensemble voting
 - Complete evaluation metrics
 - Model persistence
@@ -33,6 +35,7 @@ from sklearn.metrics import (
     roc_curve
 )
 from sklearn.preprocessing import StandardScaler
+from sklearn.feature_selection import SelectKBest, SelectFromModel, chi2
 import nltk
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
@@ -40,6 +43,8 @@ from nltk.stem import WordNetLemmatizer
 from nltk import pos_tag
 import gensim.downloader as api
 from scipy.sparse import hstack, csr_matrix
+from near_duplicate_index import NearDuplicateIndex
+from quantized_embeddings import QuantizedEmbeddings, QUANTIZED_DTYPES
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -50,7 +55,21 @@ nltk.download('averaged_perceptron_tagger', quiet=True)
 nltk.download('punkt_tab', quiet=True)
 
 class FakeNewsDetector:
-    def __init__(self):
+    def __init__(self, feature_selection=None, k_features=2000, embedding_dtype=None):
+        """
+        feature_selection: None, 'chi2' or 'l1' - optional TF-IDF n-gram
+        selection fitted on the training labels
+        k_features: number of TF-IDF n-grams kept by feature selection
+        (for 'l1', an upper bound on the n-grams with non-zero weight)
+        embedding_dtype: None, 'float16' or 'int8' - optional quantized
+        embedding table; features are then kept in float32 end to end
+        """
+        if feature_selection not in (None, 'chi2', 'l1'):
+            raise ValueError("feature_selection must be None, 'chi2' or 'l1'")
+        if k_features < 1:
+            raise ValueError("k_features must be at least 1")
+        if embedding_dtype not in (None,) + QUANTIZED_DTYPES:
+            raise ValueError("embedding_dtype must be None, 'float16' or 'int8'")
         self.tfidf_vectorizer = TfidfVectorizer(
             max_features=5000,
             ngram_range=(1, 3),
@@ -63,6 +82,11 @@ class FakeNewsDetector:
         self.lemmatizer = WordNetLemmatizer()
         self.stop_words = set(stopwords.words('english'))
         self.classifier = None
+        self.feature_selection = feature_selection
+        self.k_features = k_features
+        # Vectorizer params replaced by select_features, restored before refitting
+        self._tfidf_base_params = None
+        self.embedding_dtype = embedding_dtype
 
     def load_glove_embeddings(self):
         """Load pre-trained GloVe embeddings (Word2Vec compatible)"""
@@ -75,6 +99,16 @@ class FakeNewsDetector:
             print("Falling back to Word2Vec...")
             self.word2vec_model = api.load('word2vec-google-news-300')
 
+        if self.embedding_dtype:
+            self.quantize_embeddings()
+
+    def quantize_embeddings(self):
+        """Replace the loaded embedding table with a quantized copy"""
+        full_size = self.word2vec_model.vectors.nbytes
+        self.word2vec_model = QuantizedEmbeddings(self.word2vec_model, dtype=self.embedding_dtype)
+        print(f"Embeddings quantized to {self.embedding_dtype}: "
+              f"{full_size / 2**20:.1f} MB -> {self.word2vec_model.nbytes / 2**20:.1f} MB")
+
     def preprocess_text(self, text):
         """
         7-Step Advanced Preprocessing Pipeline:
@@ -131,10 +165,10 @@ class FakeNewsDetector:
             return None
 
     def get_word2vec_features(self, texts):
-        """Extract Word2Vec features from text"""
-        features = []
+        """Extract Word2Vec features from text (float32 document means)"""
+        features = np.zeros((len(texts), self.word2vec_model.vector_size), dtype=np.float32)
 
-        for text in texts:
+        for i, text in enumerate(texts):
             tokens = text.split()
             word_vectors = []
 
@@ -143,19 +177,62 @@ class FakeNewsDetector:
                     word_vectors.append(self.word2vec_model[token])
 
             if word_vectors:
-                features.append(np.mean(word_vectors, axis=0))
-            else:
-                features.append(np.zeros(self.word2vec_model.vector_size))
+                features[i] = np.mean(word_vectors, axis=0, dtype=np.float32)
+
+        return features
+
+    def select_features(self, texts, tfidf_features, labels):
+        """
+        Fit chi-squared or L1 selection on TF-IDF features and refit the
+        vectorizer on the selected n-grams only, so inference never
+        computes the dropped columns. Returns the reduced TF-IDF features.
+        """
+        k = min(self.k_features, tfidf_features.shape[1])
+        print(f"Selecting up to {k} of {tfidf_features.shape[1]} TF-IDF features ({self.feature_selection})...")
 
-        return np.array(features)
+        if self.feature_selection == 'chi2':
+            selector = SelectKBest(chi2, k=k)
+        else:
+            # Keeps only n-grams with non-zero L1 weight, at most k of them
+            selector = SelectFromModel(
+                LogisticRegression(penalty='l1', solver='liblinear', C=1.0, random_state=42),
+                max_features=k
+            )
+        selector.fit(tfidf_features, labels)
+
+        terms = self.tfidf_vectorizer.get_feature_names_out()[selector.get_support()]
+        if len(terms) == 0:
+            raise ValueError("Feature selection kept no TF-IDF features")
+        print(f"Kept {len(terms)} TF-IDF features.")
+        max_ngram = max(len(term.split()) for term in terms)
+
+        self._tfidf_base_params = {
+            'vocabulary': self.tfidf_vectorizer.vocabulary,
+            'ngram_range': self.tfidf_vectorizer.ngram_range
+        }
+        self.tfidf_vectorizer.set_params(
+            vocabulary=list(terms),
+            ngram_range=(self.tfidf_vectorizer.ngram_range[0], max_ngram)
+        )
+        return self.tfidf_vectorizer.fit_transform(texts)
 
-    def extract_features(self, texts, fit=False):
+    def extract_features(self, texts, fit=False, labels=None):
         """
         Hybrid Feature Extraction: TF-IDF + Word2Vec
+        Pass labels with fit=True to fit the optional feature selection
+        (required when feature_selection is set).
         """
+        if fit and self.feature_selection and labels is None:
+            raise ValueError("labels are required to fit feature selection")
+
         print("Extracting TF-IDF features...")
         if fit:
+            if self._tfidf_base_params is not None:
+                self.tfidf_vectorizer.set_params(**self._tfidf_base_params)
+                self._tfidf_base_params = None
             tfidf_features = self.tfidf_vectorizer.fit_transform(texts)
+            if self.feature_selection:
+                tfidf_features = self.select_features(texts, tfidf_features, labels)
         else:
             tfidf_features = self.tfidf_vectorizer.transform(texts)
 
@@ -165,7 +242,10 @@ class FakeNewsDetector:
         w2v_features = self.scaler.fit_transform(w2v_features) if fit else self.scaler.transform(w2v_features)
 
         print("Combining features...")
-        combined_features = hstack([tfidf_features, csr_matrix(w2v_features)])
+        if self.embedding_dtype:
+            combined_features = hstack([tfidf_features, csr_matrix(w2v_features)], format='csr', dtype=np.float32)
+        else:
+            combined_features = hstack([tfidf_features, csr_matrix(w2v_features)])
 
         return combined_features
 
@@ -259,6 +339,10 @@ class FakeNewsDetector:
     def predict(self, texts):
         """Predict on new texts"""
         processed_texts = [self.preprocess_text(text) for text in texts]
+        return self.predict_processed(processed_texts)
+
+    def predict_processed(self, processed_texts):
+        """Predict on texts already passed through preprocess_text"""
         features = self.extract_features(processed_texts, fit=False)
         predictions = self.classifier.predict(features)
         probabilities = self.classifier.predict_proba(features)
@@ -270,7 +354,10 @@ class FakeNewsDetector:
             'tfidf_vectorizer': self.tfidf_vectorizer,
             'scaler': self.scaler,
             'classifier': self.classifier,
-            'stop_words': self.stop_words
+            'stop_words': self.stop_words,
+            'feature_selection': self.feature_selection,
+            'k_features': self.k_features,
+            'tfidf_base_params': self._tfidf_base_params
         }
         with open(filepath, 'wb') as f:
             pickle.dump(model_data, f)
@@ -285,6 +372,9 @@ class FakeNewsDetector:
         self.scaler = model_data['scaler']
         self.classifier = model_data['classifier']
         self.stop_words = model_data['stop_words']
+        self.feature_selection = model_data.get('feature_selection')
+        self.k_features = model_data.get('k_features', self.k_features)
+        self._tfidf_base_params = model_data.get('tfidf_base_params')
         print(f"Model loaded from {filepath}")
 
 
@@ -348,6 +438,14 @@ def main():
 
     print(f"Preprocessing complete! Processed {len(processed_texts)} texts.")
 
+    print("\n" + "-"*70)
+    print("REMOVING NEAR-DUPLICATE ARTICLES (MinHash LSH)")
+    print("-"*70)
+    keep = NearDuplicateIndex(threshold=0.8, max_entries=len(processed_texts)).deduplicate(processed_texts)
+    print(f"Removed {len(processed_texts) - len(keep)} near-duplicates, {len(keep)} texts remain.")
+    processed_texts = [processed_texts[i] for i in keep]
+    labels = labels[keep]
+
     print("\n" + "-"*70)
     print("SPLITTING DATASET (80% train, 20% test)")
     print("-"*70)
@@ -360,7 +458,7 @@ def main():
     print("\n" + "-"*70)
     print("FEATURE EXTRACTION (TF-IDF + Word2Vec)")
     print("-"*70)
-    X_train = detector.extract_features(X_train_text, fit=True)
+    X_train = detector.extract_features(X_train_text, fit=True, labels=y_train)
     X_test = detector.extract_features(X_test_text, fit=False)
 
     print(f"Training features shape: {X_train.shape}")